@@ -1,3 +1,4 @@
+import os
 import warnings
 from dataclasses import dataclass
 from io import BytesIO, FileIO
@@ -300,6 +301,27 @@ class AudioSource:
                 AudioCache.add_to_cache(self.source, audio_bytes)
             source = BytesIO(audio_bytes)
 
+        elif (
+            self.type == "file"
+            and AudioCache.enabled()
+            and offset == 0.0
+            and duration is None
+            and os.path.getsize(self.source) <= AudioCache.max_cache_memory
+        ):
+
+            # Read the whole file once and keep the raw bytes in the cache,
+            # so that repeated reads of the same recording skip the disk I/O.
+            # Sliced reads (offset/duration) and files too large for the cache
+            # fall through to the regular path, which seeks and reads only the
+            # requested slice -- cheap for local files, and immune to the
+            # cache serving stale bytes if the file changes on disk mid-run.
+            audio_bytes = AudioCache.try_cache(self.source)
+            if not audio_bytes:
+                with open(self.source, "rb") as f:
+                    audio_bytes = f.read()
+                AudioCache.add_to_cache(self.source, audio_bytes)
+            source = BytesIO(audio_bytes)
+
         elif self.type == "memory":
 
             assert isinstance(self.source, bytes), (
@@ -80,7 +80,7 @@ def dynamic_lru_cache(method: Callable) -> Callable:
 class AudioCache:
     """
     Cache of 'bytes' objects with audio data.
-    It is used to cache the "command" type audio inputs.
+    It is used to cache the "command", "url" and "file" type audio inputs.
 
     By default it is disabled, to enable call `set_caching_enabled(True)`
     or `AudioCache.enable()`.
@@ -1,5 +1,6 @@
+from io import BytesIO
 from pathlib import Path
-from typing import Callable, Dict, List, Literal, Optional, Set, Tuple
+from typing import Callable, Dict, List, Literal, Optional, Set, Tuple, Union
 
 import numpy as np
 import torch
@@ -814,16 +815,19 @@ class Cut:
 
     def save_audio(
         self,
-        storage_path: Pathlike,
+        storage_path: Union[Pathlike, BytesIO],
         format: Optional[str] = None,
         encoding: Optional[str] = None,
         augment_fn: Optional[AugmentFn] = None,
         **kwargs,
     ) -> "Cut":
         """
-        Store this cut's waveform as audio recording to disk.
+        Store this cut's waveform as audio recording to disk,
+        or to a file-like object (in which case the resulting cut
+        keeps the encoded audio in memory).
 
-        :param storage_path: The path to location where we will store the audio recordings.
+        :param storage_path: The path to location where we will store the audio recordings,
+            or a binary file-like object (e.g. ``BytesIO``) to write the encoded audio into.
         :param format: Audio format argument supported by ``torchaudio.save`` or ``soundfile.write``.
             Please refer to the relevant library's documentation depending on which audio backend you're using.
         :param encoding: Audio encoding argument supported by ``torchaudio.save`` or ``soundfile.write``.
@@ -839,7 +843,9 @@ class Cut:
         :return: a new Cut instance.
         """
 
-        storage_path = Path(storage_path)
+        is_file_like = not isinstance(storage_path, (str, Path))
+        if not is_file_like:
+            storage_path = Path(storage_path)
         samples = self.load_audio(**kwargs)
         # TODO(@desh2608): Here, `samples` may be a list of arrays (for example, the case
         # when cut is a MixedCut and we specify `mixed=False`). For such a case, we should
@@ -855,18 +861,28 @@ class Cut:
             encoding=encoding,
         )
 
+        if is_file_like:
+            storage_path.seek(0)
+            source = AudioSource(
+                type="memory",
+                channels=list(range(self.num_channels)),
+                source=storage_path.read(),
+            )
+            recording_id = self.id
+        else:
+            source = AudioSource(
+                type="file",
+                channels=list(range(self.num_channels)),
+                source=str(storage_path),
+            )
+            recording_id = storage_path.stem
+
         recording = Recording(
-            id=storage_path.stem,
+            id=recording_id,
             sampling_rate=self.sampling_rate,
             num_samples=samples.shape[1],
             duration=samples.shape[1] / self.sampling_rate,
-            sources=[
-                AudioSource(
-                    type="file",
-                    channels=list(range(self.num_channels)),
-                    source=str(storage_path),
-                )
-            ],
+            sources=[source],
         )
         return fastcopy(
             recording.to_cut(),
@@ -1444,6 +1444,7 @@ class CutSet(Serializable, AlgorithmMixin):
         hop: Optional[Seconds] = None,
         keep_excessive_supervisions: bool = True,
         num_jobs: int = 1,
+        executor: Optional[Executor] = None,
     ) -> "CutSet":
         """
         Return a new ``CutSet``, made by traversing each ``DataCut`` in windows of ``duration`` seconds by ``hop`` seconds and
@@ -1457,10 +1458,19 @@ class CutSet(Serializable, AlgorithmMixin):
         :param keep_excessive_supervisions: bool. When a cut is truncated in the middle of a supervision segment,
             should the supervision be kept.
         :param num_jobs: The number of parallel workers.
+        :param executor: when provided together with ``num_jobs > 1``, will be used
+            to parallelize the operation instead of creating a new process pool
+            (the caller is responsible for shutting it down).
         :return: a new CutSet with cuts made from shorter duration windows.
         """
         if not hop:
             hop = duration
+        if num_jobs == 1 and executor is not None:
+            logging.warning(
+                "Executor argument was passed but num_jobs set to 1: "
+                "we will ignore the executor and use non-parallel execution."
+            )
+            executor = None
         if num_jobs == 1:
             return CutSet(
                 LazyFlattener(
@@ -1485,6 +1495,7 @@ class CutSet(Serializable, AlgorithmMixin):
             duration=duration,
             hop=hop,
             keep_excessive_supervisions=keep_excessive_supervisions,
+            executor=executor,
         )
         return result
 
@@ -1,4 +1,4 @@
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import Executor, ProcessPoolExecutor
 from functools import reduce
 from itertools import chain
 from operator import add
@@ -31,7 +31,12 @@ def combine(*manifests: Union[Manifest, Iterable[Manifest]]) -> Manifest:
 
 
 def split_parallelize_combine(
-    num_jobs: int, manifest: Manifest, fn: Callable, *args, **kwargs
+    num_jobs: int,
+    manifest: Manifest,
+    fn: Callable,
+    *args,
+    executor: Optional[Executor] = None,
+    **kwargs,
 ) -> Manifest:
     """
     Convenience wrapper that parallelizes the execution of functions
@@ -63,9 +68,16 @@ def split_parallelize_combine(
         has to be ``manifest`` (for methods, they have to be methods on that manifests type,
         e.g. ``CutSet.cut_into_windows``.
     :param args: positional arguments to ``fn``.
+    :param executor: when provided, will be used to parallelize the execution
+        instead of a newly created ``ProcessPoolExecutor`` (useful to amortize
+        the worker start-up cost across multiple calls). The caller is
+        responsible for shutting it down.
     :param kwargs keyword arguments to ``fn``.
     """
     splits = manifest.split(num_splits=num_jobs)
+    if executor is not None:
+        futures = [executor.submit(fn, subset, *args, **kwargs) for subset in splits]
+        return combine([f.result() for f in futures])
     with ProcessPoolExecutor(num_jobs) as ex:
         futures = [ex.submit(fn, subset, *args, **kwargs) for subset in splits]
         result = combine([f.result() for f in futures])
@@ -1,7 +1,7 @@
 import contextlib
 from io import BytesIO
 from tempfile import NamedTemporaryFile
-from typing import Dict, List, Optional, Type, Union
+from typing import Dict, Iterable, List, Optional, Type, Union
 
 import numpy as np
 import torch
@@ -192,6 +192,34 @@ def dummy_supervision(
     )
 
 
+def dummy_supervisions_batch(
+    n: int,
+    first_id: int = 0,
+    durations: Optional[Iterable[float]] = None,
+) -> List[SupervisionSegment]:
+    """
+    Batched variant of :func:`.dummy_supervision`: constructs a single prototype
+    segment and derives the remaining ones via :func:`~lhotse.utils.fastcopy`,
+    instead of re-building every shared field for each segment.
+    Each segment receives its own ``custom`` dict and ``alignment``,
+    so that in-place mutations don't leak between segments.
+    """
+    base = dummy_supervision(first_id)
+    if durations is None:
+        durations = [base.duration] * n
+    return [
+        fastcopy(
+            base,
+            id=f"dummy-segment-{first_id + i:04d}",
+            recording_id=f"dummy-recording-{first_id + i:04d}",
+            duration=duration,
+            custom=dict(base.custom),
+            alignment={key: list(items) for key, items in base.alignment.items()},
+        )
+        for i, duration in zip(range(n), durations)
+    ]
+
+
 def dummy_features(
     unique_id: int, start: float = 0.0, duration: float = 1.0, with_data: bool = False
 ) -> Features:
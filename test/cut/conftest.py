@@ -1,129 +1,196 @@
+import gzip
+import json
+from pathlib import Path
+from typing import Callable, Dict, Union
+
 import pytest
 
 from lhotse.audio import AudioSource, Recording
+from lhotse.caching import is_caching_enabled, set_caching_enabled
 from lhotse.cut import CutSet, MonoCut, MultiCut
 from lhotse.features import Features
 from lhotse.supervision import SupervisionSegment
+from lhotse.utils import Pathlike, fastcopy
+
+
+@pytest.fixture(scope="package", autouse=True)
+def cache_audio_fixtures():
+    """
+    The audio fixtures in these tests are static files, so we let Lhotse
+    cache their raw bytes in memory instead of re-reading them from disk
+    on every ``load_audio()`` call.
+    """
+    previous = is_caching_enabled()
+    set_caching_enabled(True)
+    yield
+    set_caching_enabled(previous)
+
+
+# Raw (decompressed) contents of the gzipped JSON fixtures, keyed by path.
+_GZIPPED_JSON_CACHE: Dict[str, bytes] = {}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def gzipped_json_cache() -> Callable[[Pathlike], Union[dict, list]]:
+    """
+    Decompresses every ``*.json.gz`` fixture exactly once per test session
+    and returns a loader that parses the cached bytes, so that tests don't
+    repeat the gunzip + disk read for each fixture instantiation.
+    """
+    for path in Path("test/fixtures").rglob("*.json.gz"):
+        with gzip.open(path, "rb") as f:
+            _GZIPPED_JSON_CACHE[str(path)] = f.read()
+
+    def load(path: Pathlike) -> Union[dict, list]:
+        return json.loads(_GZIPPED_JSON_CACHE[str(path)])
+
+    return load
+
+
+# Prototype manifests are constructed once at import time; the fixtures below
+# hand out fastcopies of them, which is considerably cheaper than re-running
+# the constructors for every test.
+
+_DUMMY_FEATURES = Features(
+    recording_id="irrelevant",
+    channels=0,
+    start=0.0,
+    duration=10.0,
+    type="fbank",
+    num_frames=1000,
+    num_features=80,
+    sampling_rate=16000,
+    storage_type="irrelevant",
+    storage_path="irrelevant",
+    storage_key="irrelevant",
+    frame_shift=0.01,
+)
+
+_DUMMY_RECORDING = Recording(
+    id="irrelevant",
+    sources=[AudioSource(type="file", channels=[0], source="irrelevant")],
+    sampling_rate=16000,
+    num_samples=160000,
+    duration=10.0,
+)
+
+_CUT1 = MonoCut(
+    id="cut-1",
+    start=0.0,
+    duration=10.0,
+    channel=0,
+    features=_DUMMY_FEATURES,
+    recording=_DUMMY_RECORDING,
+    supervisions=[
+        SupervisionSegment(
+            id="sup-1", recording_id="irrelevant", start=0.5, duration=6.0
+        ),
+        SupervisionSegment(
+            id="sup-2", recording_id="irrelevant", start=7.0, duration=2.0
+        ),
+    ],
+)
+
+_CUT2 = MonoCut(
+    id="cut-2",
+    start=180.0,
+    duration=10.0,
+    channel=0,
+    features=_DUMMY_FEATURES,
+    recording=_DUMMY_RECORDING,
+    supervisions=[
+        SupervisionSegment(
+            id="sup-3", recording_id="irrelevant", start=3.0, duration=2.5
+        )
+    ],
+)
+
+_MULTI_CUT1 = MultiCut(
+    id="multi-cut-1",
+    start=0.0,
+    duration=10.0,
+    channel=[0, 1],
+    features=_DUMMY_FEATURES,
+    recording=_DUMMY_RECORDING,
+    supervisions=[
+        SupervisionSegment(
+            id="sup-1", recording_id="irrelevant", start=0.5, duration=6.0
+        ),
+        SupervisionSegment(
+            id="sup-2", recording_id="irrelevant", start=7.0, duration=2.0
+        ),
+    ],
+)
+
+_MULTI_CUT2 = MultiCut(
+    id="cut-2",
+    start=180.0,
+    duration=10.0,
+    channel=[0, 1],
+    features=_DUMMY_FEATURES,
+    recording=_DUMMY_RECORDING,
+    supervisions=[
+        SupervisionSegment(
+            id="sup-3", recording_id="irrelevant", start=3.0, duration=2.5
+        )
+    ],
+)
+
+_MULTI_CUT3 = MultiCut(
+    id="cut-2",
+    start=180.0,
+    duration=10.0,
+    channel=[1, 2],
+    features=_DUMMY_FEATURES,
+    recording=_DUMMY_RECORDING,
+    supervisions=[
+        SupervisionSegment(
+            id="sup-3", recording_id="irrelevant", start=3.0, duration=2.5
+        )
+    ],
+)
+
+
+def _cut_copy(proto):
+    # Shallow copy with a fresh supervision list, so that tests may reassign
+    # the cut's attributes or extend its supervisions without affecting
+    # the prototypes.
+    return fastcopy(proto, supervisions=list(proto.supervisions))
 
 
 @pytest.fixture
 def dummy_features():
-    return Features(
-        recording_id="irrelevant",
-        channels=0,
-        start=0.0,
-        duration=10.0,
-        type="fbank",
-        num_frames=1000,
-        num_features=80,
-        sampling_rate=16000,
-        storage_type="irrelevant",
-        storage_path="irrelevant",
-        storage_key="irrelevant",
-        frame_shift=0.01,
-    )
+    return fastcopy(_DUMMY_FEATURES)
 
 
 @pytest.fixture
 def dummy_recording():
-    return Recording(
-        id="irrelevant",
-        sources=[AudioSource(type="file", channels=[0], source="irrelevant")],
-        sampling_rate=16000,
-        num_samples=160000,
-        duration=10.0,
-    )
+    return fastcopy(_DUMMY_RECORDING)
 
 
 @pytest.fixture
-def cut1(dummy_features, dummy_recording):
-    return MonoCut(
-        id="cut-1",
-        start=0.0,
-        duration=10.0,
-        channel=0,
-        features=dummy_features,
-        recording=dummy_recording,
-        supervisions=[
-            SupervisionSegment(
-                id="sup-1", recording_id="irrelevant", start=0.5, duration=6.0
-            ),
-            SupervisionSegment(
-                id="sup-2", recording_id="irrelevant", start=7.0, duration=2.0
-            ),
-        ],
-    )
+def cut1():
+    return _cut_copy(_CUT1)
 
 
 @pytest.fixture
-def cut2(dummy_features, dummy_recording):
-    return MonoCut(
-        id="cut-2",
-        start=180.0,
-        duration=10.0,
-        channel=0,
-        features=dummy_features,
-        recording=dummy_recording,
-        supervisions=[
-            SupervisionSegment(
-                id="sup-3", recording_id="irrelevant", start=3.0, duration=2.5
-            )
-        ],
-    )
+def cut2():
+    return _cut_copy(_CUT2)
 
 
 @pytest.fixture
-def multi_cut1(dummy_features, dummy_recording):
-    return MultiCut(
-        id="multi-cut-1",
-        start=0.0,
-        duration=10.0,
-        channel=[0, 1],
-        features=dummy_features,
-        recording=dummy_recording,
-        supervisions=[
-            SupervisionSegment(
-                id="sup-1", recording_id="irrelevant", start=0.5, duration=6.0
-            ),
-            SupervisionSegment(
-                id="sup-2", recording_id="irrelevant", start=7.0, duration=2.0
-            ),
-        ],
-    )
+def multi_cut1():
+    return _cut_copy(_MULTI_CUT1)
 
 
 @pytest.fixture
-def multi_cut2(dummy_features, dummy_recording):
-    return MultiCut(
-        id="cut-2",
-        start=180.0,
-        duration=10.0,
-        channel=[0, 1],
-        features=dummy_features,
-        recording=dummy_recording,
-        supervisions=[
-            SupervisionSegment(
-                id="sup-3", recording_id="irrelevant", start=3.0, duration=2.5
-            )
-        ],
-    )
+def multi_cut2():
+    return _cut_copy(_MULTI_CUT2)
 
 
 @pytest.fixture
-def multi_cut3(dummy_features, dummy_recording):
-    return MultiCut(
-        id="cut-2",
-        start=180.0,
-        duration=10.0,
-        channel=[1, 2],
-        features=dummy_features,
-        recording=dummy_recording,
-        supervisions=[
-            SupervisionSegment(
-                id="sup-3", recording_id="irrelevant", start=3.0, duration=2.5
-            )
-        ],
-    )
+def multi_cut3():
+    return _cut_copy(_MULTI_CUT3)
 
 
 @pytest.fixture
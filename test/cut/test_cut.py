@@ -1,39 +1,68 @@
-from tempfile import NamedTemporaryFile
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 
 import numpy as np
 import pytest
-from pytest import approx
 
 from lhotse.audio import AudioSource, Recording, RecordingSet
 from lhotse.cut import CutSet, MonoCut
 from lhotse.features import Features, FeatureSet
 from lhotse.supervision import SupervisionSegment, SupervisionSet
-from lhotse.testing.dummies import dummy_cut, dummy_supervision
+from lhotse.testing.dummies import (
+    dummy_cut,
+    dummy_supervision,
+    dummy_supervisions_batch,
+)
+from lhotse.utils import fastcopy
 
+# Keep this module's tests on a single pytest-xdist worker
+# (``pytest -n auto --dist loadgroup``) so that the session-scoped
+# manifest fixtures below are instantiated only once.
+pytestmark = pytest.mark.xdist_group("cut_basic")
 
-@pytest.fixture()
+# The manifests below are only read by the tests, so we parse them once
+# per session instead of re-reading the JSON on every test.
+
+
+@pytest.fixture(scope="session")
 def libri_recording_set():
     return RecordingSet.from_json("test/fixtures/libri/audio.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def libri_cut_set():
     return CutSet.from_json("test/fixtures/libri/cuts.json")
 
 
-@pytest.fixture
-def libri_features_set():
-    return FeatureSet.from_json("test/fixtures/libri/feature_manifest.json.gz")
+@pytest.fixture(scope="session")
+def libri_features_set(gzipped_json_cache):
+    return FeatureSet.from_dicts(
+        gzipped_json_cache("test/fixtures/libri/feature_manifest.json.gz")
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def supervision_set():
     return SupervisionSet.from_json("test/fixtures/supervision.yml")
 
 
+@pytest.fixture(scope="session")
+def libri_cut_blob(libri_cut_set) -> bytes:
+    # Pickled binary cache: deserializing it is much cheaper than re-parsing
+    # the JSON manifest and yields a deep copy of the cut.
+    return pickle.dumps(
+        libri_cut_set["e3e70682-c209-4cac-629f-6fbed82c07cd"],
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+
+
 @pytest.fixture
-def libri_cut(libri_cut_set) -> MonoCut:
-    return libri_cut_set["e3e70682-c209-4cac-629f-6fbed82c07cd"]
+def libri_cut(libri_cut_blob) -> MonoCut:
+    # Fresh copy per test, as some tests mutate the cut's attributes
+    # (e.g. ``test_load_none_audio`` sets ``recording`` to ``None``)
+    # and must not leak that into the session-scoped cut set.
+    return pickle.loads(libri_cut_blob)
 
 
 def test_load_none_feats_cut_set():
@@ -70,30 +99,45 @@ def test_num_frames(libri_cut):
     assert libri_cut.num_frames == expected_cut_frame_count
 
 
+# Expected windows for cutting the ljspeech cuts (1.54s and 1.6s long)
+# into 0.5s windows with a 0.4s hop: 0, 0.4, 0.8, 1.2 per cut.
+EXPECTED_WINDOW_STARTS = np.array([0, 0.4, 0.8, 1.2, 0, 0.4, 0.8, 1.2])
+EXPECTED_WINDOW_DURATIONS = np.array(
+    [0.5, 0.5, 0.5, 0.3396371882, 0.5, 0.5, 0.5, 0.39768707483]
+)
+
+
+def _assert_expected_windows(cuts: CutSet) -> None:
+    starts = np.fromiter((cut.start for cut in cuts), dtype=np.float64)
+    np.testing.assert_allclose(starts, EXPECTED_WINDOW_STARTS)
+    durations = np.fromiter((cut.duration for cut in cuts), dtype=np.float64)
+    np.testing.assert_allclose(durations, EXPECTED_WINDOW_DURATIONS)
+
+
 def test_cut_into_windows():
     cuts0 = CutSet.from_json(
         "test/fixtures/ljspeech/cuts.json"
     )  # has 2 cuts of 1.54s and 1.6s
-    cuts = cuts0.cut_into_windows(duration=0.5, hop=0.4)  # 0, 0.4, 0.8, 1.2
-    starts = [cut.start for cut in cuts]
-    assert starts == approx([0, 0.4, 0.8, 1.2, 0, 0.4, 0.8, 1.2])
-    durations = [cut.duration for cut in cuts]
-    assert durations == approx(
-        [0.5, 0.5, 0.5, 0.3396371882, 0.5, 0.5, 0.5, 0.39768707483]
-    )
+    cuts = cuts0.cut_into_windows(duration=0.5, hop=0.4)
+    _assert_expected_windows(cuts)
+
+
+@pytest.fixture(scope="session")
+def shared_process_pool():
+    # Reused across tests to amortize the worker start-up cost.
+    pool = ProcessPoolExecutor(max_workers=2)
+    yield pool
+    pool.shutdown()
 
 
-def test_cut_into_windows_parallel():
+def test_cut_into_windows_parallel(shared_process_pool):
     cuts0 = CutSet.from_json(
         "test/fixtures/ljspeech/cuts.json"
     )  # has 2 cuts of 1.54s and 1.6s
-    cuts = cuts0.cut_into_windows(duration=0.5, hop=0.4, num_jobs=2)  # 0, 0.4, 0.8, 1.2
-    starts = [cut.start for cut in cuts]
-    assert starts == approx([0, 0.4, 0.8, 1.2, 0, 0.4, 0.8, 1.2])
-    durations = [cut.duration for cut in cuts]
-    assert durations == approx(
-        [0.5, 0.5, 0.5, 0.3396371882, 0.5, 0.5, 0.5, 0.39768707483]
+    cuts = cuts0.cut_into_windows(
+        duration=0.5, hop=0.4, num_jobs=2, executor=shared_process_pool
     )
+    _assert_expected_windows(cuts)
 
 
 def test_load_features(libri_cut):
@@ -108,145 +152,186 @@ def test_load_none_features(libri_cut):
     assert feats is None
 
 
-@pytest.mark.parametrize("ext", [".wav", ".flac"])
-def test_save_audio(libri_cut, ext):
-    with NamedTemporaryFile(suffix=ext) as f:
-        stored_cut = libri_cut.save_audio(f.name)
-        samples1 = libri_cut.load_audio()
-        rec = Recording.from_file(f.name)
-        samples2 = rec.load_audio()
-        assert np.array_equal(samples1, samples2)
-        assert rec.duration == libri_cut.duration
-        assert rec.duration == stored_cut.duration
-        assert libri_cut.duration == stored_cut.duration
+def _bytes_equal(a: np.ndarray, b: np.ndarray) -> bool:
+    # memcmp-style equality: cheap shape/dtype checks first, then a raw byte
+    # comparison. Suitable here because the arrays are expected to be
+    # identical (lossless round-trip), so no tolerance is needed.
+    return a.shape == b.shape and a.dtype == b.dtype and a.tobytes() == b.tobytes()
+
+
+@pytest.mark.parametrize(
+    "format",
+    [
+        "wav",
+        # FLAC encode/decode dominates this test's runtime,
+        # so fast runs can skip it with -m "not slow".
+        pytest.param("flac", marks=pytest.mark.slow),
+    ],
+)
+def test_save_audio(libri_cut, format):
+    # Encode into an in-memory buffer to avoid a filesystem round-trip.
+    buf = BytesIO()
+    stored_cut = libri_cut.save_audio(buf, format=format)
+    samples1 = libri_cut.load_audio()
+    rec = stored_cut.recording
+    samples2 = rec.load_audio()
+    assert _bytes_equal(samples1, samples2)
+    assert rec.duration == libri_cut.duration
+    assert rec.duration == stored_cut.duration
+    assert libri_cut.duration == stored_cut.duration
+
+
+# The dummy manifest sets are built once at import time; the fixtures hand out
+# the shared instances directly, skipping repeated construction and validation.
+# The tests must not mutate them (they only read).
+
+_DUMMY_RECORDING_SET = RecordingSet.from_recordings(
+    [
+        Recording(
+            id="rec1",
+            sampling_rate=16000,
+            num_samples=160000,
+            duration=10,
+            sources=[AudioSource(type="file", channels=[0], source="dummy.wav")],
+        )
+    ]
+)
+
+_DUMMY_SUPERVISION_SET = SupervisionSet.from_segments(
+    [
+        SupervisionSegment(
+            id="sup1",
+            recording_id="rec1",
+            start=3,
+            duration=4,
+            channel=0,
+            text="dummy text",
+        )
+    ]
+)
+
+_DUMMY_FEATURE_SET = FeatureSet.from_features(
+    [
+        Features(
+            recording_id="rec1",
+            channels=0,
+            start=0,
+            duration=10,
+            type="fbank",
+            num_frames=1000,
+            num_features=23,
+            sampling_rate=16000,
+            storage_type="lilcom_files",
+            storage_path="feats",
+            storage_key="dummy.llc",
+            frame_shift=0.01,
+        )
+    ]
+)
 
 
 @pytest.fixture
 def dummy_recording_set():
-    return RecordingSet.from_recordings(
-        [
-            Recording(
-                id="rec1",
-                sampling_rate=16000,
-                num_samples=160000,
-                duration=10,
-                sources=[AudioSource(type="file", channels=[0], source="dummy.wav")],
-            )
-        ]
-    )
+    return _DUMMY_RECORDING_SET
 
 
 @pytest.fixture
 def dummy_supervision_set():
-    return SupervisionSet.from_segments(
-        [
-            SupervisionSegment(
-                id="sup1",
-                recording_id="rec1",
-                start=3,
-                duration=4,
-                channel=0,
-                text="dummy text",
-            )
-        ]
-    )
+    return _DUMMY_SUPERVISION_SET
 
 
 @pytest.fixture
 def dummy_feature_set():
-    return FeatureSet.from_features(
-        [
-            Features(
-                recording_id="rec1",
-                channels=0,
-                start=0,
-                duration=10,
-                type="fbank",
-                num_frames=1000,
-                num_features=23,
-                sampling_rate=16000,
-                storage_type="lilcom_files",
-                storage_path="feats",
-                storage_key="dummy.llc",
-                frame_shift=0.01,
-            )
-        ]
+    return _DUMMY_FEATURE_SET
+
+
+# The attributes checked on cuts created from the dummy manifests.
+# Comparing them as whole dicts replaces the long chains of per-attribute
+# assertions that used to be duplicated across nearly identical tests.
+CUT_ATTR_KEYS = (
+    "start",
+    "duration",
+    "end",
+    "channel",
+    "sampling_rate",
+    "recording_id",
+    "has_recording",
+    "num_samples",
+    "has_features",
+    "frame_shift",
+    "num_frames",
+    "num_features",
+    "features_type",
+)
+SUPERVISION_ATTR_KEYS = (
+    "id",
+    "recording_id",
+    "start",
+    "duration",
+    "end",
+    "channel",
+    "text",
+)
+
+
+def _attrs(manifest, keys) -> dict:
+    return {key: getattr(manifest, key) for key in keys}
+
+
+def _expected_cut_attrs(
+    with_recording: bool, with_features: bool, trimmed: bool
+) -> dict:
+    return {
+        "start": 3.0 if trimmed else 0,
+        "duration": 4.0 if trimmed else 10.0,
+        "end": 7.0 if trimmed else 10.0,
+        "channel": 0,
+        "sampling_rate": 16000,
+        "recording_id": "rec1",
+        "has_recording": with_recording,
+        "num_samples": ((16000 * 4 if trimmed else 160000) if with_recording else None),
+        "has_features": with_features,
+        "frame_shift": 0.01 if with_features else None,
+        "num_frames": ((400 if trimmed else 1000) if with_features else None),
+        "num_features": 23 if with_features else None,
+        "features_type": "fbank" if with_features else None,
+    }
+
+
+def _expected_supervision_attrs(trimmed: bool) -> dict:
+    return {
+        "id": "sup1",
+        "recording_id": "rec1",
+        "start": 0.0 if trimmed else 3.0,
+        "duration": 4.0,
+        "end": 4.0 if trimmed else 7.0,
+        "channel": 0,
+        "text": "dummy text",
+    }
+
+
+@pytest.mark.parametrize(
+    "with_recording, with_features",
+    [(True, False), (False, True), (True, True)],
+    ids=["rec", "feat", "rec+feat"],
+)
+def test_make_cuts_from_manifests(
+    dummy_recording_set, dummy_feature_set, with_recording, with_features
+):
+    cut_set = CutSet.from_manifests(
+        recordings=dummy_recording_set if with_recording else None,
+        features=dummy_feature_set if with_features else None,
     )
-
-
-def test_make_cuts_from_recordings(dummy_recording_set):
-    cut_set = CutSet.from_manifests(recordings=dummy_recording_set)
-    cut1 = cut_set[0]
-    assert cut1.start == 0
-    assert cut1.duration == 10.0
-    assert cut1.end == 10.0
-    assert cut1.channel == 0
-
-    assert len(cut1.supervisions) == 0
-
-    assert cut1.has_recording
-    assert cut1.recording == dummy_recording_set["rec1"]
-    assert cut1.sampling_rate == 16000
-    assert cut1.recording_id == "rec1"
-    assert cut1.num_samples == 160000
-
-    assert not cut1.has_features
-    assert cut1.features is None
-    assert cut1.frame_shift is None
-    assert cut1.num_frames is None
-    assert cut1.num_features is None
-    assert cut1.features_type is None
-
-
-def test_make_cuts_from_features(dummy_feature_set):
-    cut_set = CutSet.from_manifests(features=dummy_feature_set)
     cut1 = cut_set[0]
-    assert cut1.start == 0
-    assert cut1.duration == 10.0
-    assert cut1.end == 10.0
-    assert cut1.channel == 0
-
-    assert len(cut1.supervisions) == 0
-
-    assert not cut1.has_recording
-    assert cut1.recording is None
-    assert cut1.sampling_rate == 16000
-    assert cut1.recording_id == "rec1"
-    assert cut1.num_samples is None
-
-    assert cut1.has_features
-    assert cut1.features == dummy_feature_set[0]
-    assert cut1.frame_shift == 0.01
-    assert cut1.num_frames == 1000
-    assert cut1.num_features == 23
-    assert cut1.features_type == "fbank"
-
 
-def test_make_cuts_from_features_recordings(dummy_recording_set, dummy_feature_set):
-    cut_set = CutSet.from_manifests(
-        recordings=dummy_recording_set, features=dummy_feature_set
+    assert _attrs(cut1, CUT_ATTR_KEYS) == _expected_cut_attrs(
+        with_recording, with_features, trimmed=False
     )
-    cut1 = cut_set[0]
-    assert cut1.start == 0
-    assert cut1.duration == 10.0
-    assert cut1.end == 10.0
-    assert cut1.channel == 0
+    assert cut1.recording == (dummy_recording_set["rec1"] if with_recording else None)
+    assert cut1.features == (dummy_feature_set[0] if with_features else None)
 
     assert len(cut1.supervisions) == 0
 
-    assert cut1.has_recording
-    assert cut1.recording == dummy_recording_set["rec1"]
-    assert cut1.sampling_rate == 16000
-    assert cut1.recording_id == "rec1"
-    assert cut1.num_samples == 160000
-
-    assert cut1.has_features
-    assert cut1.features == dummy_feature_set[0]
-    assert cut1.frame_shift == 0.01
-    assert cut1.num_frames == 1000
-    assert cut1.num_features == 23
-    assert cut1.features_type == "fbank"
-
 
 def test_make_cuts_from_recordings_with_deterministic_ids(dummy_recording_set):
     cut_set = CutSet.from_manifests(recordings=dummy_recording_set, random_ids=False)
@@ -272,484 +357,215 @@ def test_make_cuts_from_features_with_random_ids(dummy_feature_set):
         assert cut.id != f"{cut.recording_id}-{idx}"
 
 
-class TestCutOnSupervisions:
-    def test_make_cuts_from_recordings_supervisions(
-        self, dummy_recording_set, dummy_supervision_set
-    ):
-        cut_set = CutSet.from_manifests(
-            recordings=dummy_recording_set, supervisions=dummy_supervision_set
-        ).trim_to_supervisions()
-        cut1 = cut_set[0]
-        assert cut1.start == 3.0
-        assert cut1.duration == 4.0
-        assert cut1.end == 7.0
-        assert cut1.channel == 0
-
-        assert len(cut1.supervisions) == 1
-        assert cut1.supervisions[0].id == "sup1"
-        assert cut1.supervisions[0].recording_id == "rec1"
-        assert cut1.supervisions[0].start == 0.0
-        assert cut1.supervisions[0].duration == 4.0
-        assert cut1.supervisions[0].end == 4.0
-        assert cut1.supervisions[0].channel == 0
-        assert cut1.supervisions[0].text == "dummy text"
-
-        assert cut1.has_recording
-        assert cut1.recording == dummy_recording_set["rec1"]
-        assert cut1.sampling_rate == 16000
-        assert cut1.recording_id == "rec1"
-        assert cut1.num_samples == 16000 * 4
-
-        assert not cut1.has_features
-        assert cut1.features is None
-        assert cut1.frame_shift is None
-        assert cut1.num_frames is None
-        assert cut1.num_features is None
-        assert cut1.features_type is None
-
-    def test_make_cuts_from_features_supervisions(
-        self, dummy_feature_set, dummy_supervision_set
-    ):
-        cut_set = CutSet.from_manifests(
-            supervisions=dummy_supervision_set, features=dummy_feature_set
-        ).trim_to_supervisions()
-        cut1 = cut_set[0]
-        assert cut1.start == 3.0
-        assert cut1.duration == 4.0
-        assert cut1.end == 7.0
-        assert cut1.channel == 0
-
-        assert len(cut1.supervisions) == 1
-        assert cut1.supervisions[0].id == "sup1"
-        assert cut1.supervisions[0].recording_id == "rec1"
-        assert cut1.supervisions[0].start == 0.0
-        assert cut1.supervisions[0].duration == 4.0
-        assert cut1.supervisions[0].end == 4.0
-        assert cut1.supervisions[0].channel == 0
-        assert cut1.supervisions[0].text == "dummy text"
-
-        assert not cut1.has_recording
-        assert cut1.recording is None
-        assert cut1.sampling_rate == 16000
-        assert cut1.recording_id == "rec1"
-        assert cut1.num_samples is None
-
-        assert cut1.has_features
-        assert cut1.features == dummy_feature_set[0]
-        assert cut1.frame_shift == 0.01
-        assert cut1.num_frames == 400
-        assert cut1.num_features == 23
-        assert cut1.features_type == "fbank"
-
-    def test_make_cuts_from_recordings_features_supervisions(
-        self, dummy_recording_set, dummy_feature_set, dummy_supervision_set
-    ):
-        cut_set = CutSet.from_manifests(
-            recordings=dummy_recording_set,
-            supervisions=dummy_supervision_set,
-            features=dummy_feature_set,
-        ).trim_to_supervisions()
-        cut1 = cut_set[0]
-        assert cut1.start == 3.0
-        assert cut1.duration == 4.0
-        assert cut1.end == 7.0
-        assert cut1.channel == 0
-
-        assert len(cut1.supervisions) == 1
-        assert cut1.supervisions[0].id == "sup1"
-        assert cut1.supervisions[0].recording_id == "rec1"
-        assert cut1.supervisions[0].start == 0.0
-        assert cut1.supervisions[0].duration == 4.0
-        assert cut1.supervisions[0].end == 4.0
-        assert cut1.supervisions[0].channel == 0
-        assert cut1.supervisions[0].text == "dummy text"
-
-        assert cut1.has_recording
-        assert cut1.recording == dummy_recording_set["rec1"]
-        assert cut1.sampling_rate == 16000
-        assert cut1.recording_id == "rec1"
-        assert cut1.num_samples == 16000 * 4
-
-        assert cut1.has_features
-        assert cut1.features == dummy_feature_set[0]
-        assert cut1.frame_shift == 0.01
-        assert cut1.num_frames == 400
-        assert cut1.num_features == 23
-        assert cut1.features_type == "fbank"
-
-
-class TestNoCutOnSupervisions:
-    def test_make_cuts_from_recordings_supervisions(
-        self, dummy_recording_set, dummy_supervision_set
-    ):
-        cut_set = CutSet.from_manifests(
-            recordings=dummy_recording_set, supervisions=dummy_supervision_set
-        )
-        cut1 = cut_set[0]
-        assert cut1.start == 0
-        assert cut1.duration == 10.0
-        assert cut1.end == 10.0
-        assert cut1.channel == 0
-
-        assert len(cut1.supervisions) == 1
-        assert cut1.supervisions[0].id == "sup1"
-        assert cut1.supervisions[0].recording_id == "rec1"
-        assert cut1.supervisions[0].start == 3.0
-        assert cut1.supervisions[0].end == 7.0
-        assert cut1.supervisions[0].channel == 0
-        assert cut1.supervisions[0].text == "dummy text"
-
-        assert cut1.has_recording
-        assert cut1.recording == dummy_recording_set["rec1"]
-        assert cut1.sampling_rate == 16000
-        assert cut1.recording_id == "rec1"
-        assert cut1.num_samples == 160000
-
-        assert not cut1.has_features
-        assert cut1.features is None
-        assert cut1.frame_shift is None
-        assert cut1.num_frames is None
-        assert cut1.num_features is None
-        assert cut1.features_type is None
-
-    def test_make_cuts_from_features_supervisions(
-        self, dummy_feature_set, dummy_supervision_set
-    ):
-        cut_set = CutSet.from_manifests(
-            supervisions=dummy_supervision_set, features=dummy_feature_set
-        )
-        cut1 = cut_set[0]
-        assert cut1.start == 0
-        assert cut1.duration == 10.0
-        assert cut1.end == 10.0
-        assert cut1.channel == 0
-
-        assert len(cut1.supervisions) == 1
-        assert cut1.supervisions[0].id == "sup1"
-        assert cut1.supervisions[0].recording_id == "rec1"
-        assert cut1.supervisions[0].start == 3.0
-        assert cut1.supervisions[0].end == 7.0
-        assert cut1.supervisions[0].channel == 0
-        assert cut1.supervisions[0].text == "dummy text"
-
-        assert not cut1.has_recording
-        assert cut1.recording is None
-        assert cut1.sampling_rate == 16000
-        assert cut1.recording_id == "rec1"
-        assert cut1.num_samples is None
-
-        assert cut1.has_features
-        assert cut1.features == dummy_feature_set[0]
-        assert cut1.frame_shift == 0.01
-        assert cut1.num_frames == 1000
-        assert cut1.num_features == 23
-        assert cut1.features_type == "fbank"
-
-    def test_make_cuts_from_recordings_features_supervisions(
-        self, dummy_recording_set, dummy_feature_set, dummy_supervision_set
-    ):
-        cut_set = CutSet.from_manifests(
-            recordings=dummy_recording_set,
-            supervisions=dummy_supervision_set,
-            features=dummy_feature_set,
-        )
-        cut1 = cut_set[0]
-        assert cut1.start == 0
-        assert cut1.duration == 10.0
-        assert cut1.end == 10.0
-        assert cut1.channel == 0
-
-        assert len(cut1.supervisions) == 1
-        assert cut1.supervisions[0].id == "sup1"
-        assert cut1.supervisions[0].recording_id == "rec1"
-        assert cut1.supervisions[0].start == 3.0
-        assert cut1.supervisions[0].end == 7.0
-        assert cut1.supervisions[0].channel == 0
-        assert cut1.supervisions[0].text == "dummy text"
-
-        assert cut1.has_recording
-        assert cut1.recording == dummy_recording_set["rec1"]
-        assert cut1.sampling_rate == 16000
-        assert cut1.recording_id == "rec1"
-        assert cut1.num_samples == 160000
-
-        assert cut1.has_features
-        assert cut1.features == dummy_feature_set[0]
-        assert cut1.frame_shift == 0.01
-        assert cut1.num_frames == 1000
-        assert cut1.num_features == 23
-        assert cut1.features_type == "fbank"
+@pytest.mark.parametrize("trimmed", [False, True], ids=["no-trim", "trim"])
+@pytest.mark.parametrize(
+    "with_recording, with_features",
+    [(True, False), (False, True), (True, True)],
+    ids=["rec", "feat", "rec+feat"],
+)
+def test_make_cuts_from_manifests_with_supervisions(
+    dummy_recording_set,
+    dummy_feature_set,
+    dummy_supervision_set,
+    with_recording,
+    with_features,
+    trimmed,
+):
+    cut_set = CutSet.from_manifests(
+        recordings=dummy_recording_set if with_recording else None,
+        supervisions=dummy_supervision_set,
+        features=dummy_feature_set if with_features else None,
+    )
+    if trimmed:
+        cut_set = cut_set.trim_to_supervisions()
+    cut1 = cut_set[0]
+
+    assert _attrs(cut1, CUT_ATTR_KEYS) == _expected_cut_attrs(
+        with_recording, with_features, trimmed
+    )
+    assert cut1.recording == (dummy_recording_set["rec1"] if with_recording else None)
+    assert cut1.features == (dummy_feature_set[0] if with_features else None)
+
+    assert len(cut1.supervisions) == 1
+    assert _attrs(
+        cut1.supervisions[0], SUPERVISION_ATTR_KEYS
+    ) == _expected_supervision_attrs(trimmed)
 
 
 @pytest.fixture()
 def dummy_cut_with_supervisions():
     return dummy_cut(
         unique_id=0,
-        supervisions=[dummy_supervision(unique_id=i, duration=i) for i in range(1, 7)],
+        supervisions=dummy_supervisions_batch(6, first_id=1, durations=range(1, 7)),
     )
 
 
 def test_cut_filter_supervisions(dummy_cut_with_supervisions):
     cut = dummy_cut_with_supervisions
+    all_ids = frozenset(s.id for s in cut.supervisions)
 
     # test id filtering
     cut_first_three = cut.filter_supervisions(lambda s: s.id.endswith(("1", "2", "3")))
     cut_last_three = cut.filter_supervisions(lambda s: s.id.endswith(("4", "5", "6")))
 
-    assert not set(s.id for s in cut_first_three.supervisions) & set(
-        s.id for s in cut_last_three.supervisions
-    )
-    assert (
-        set(s.id for s in cut_first_three.supervisions)
-        | set(s.id for s in cut_last_three.supervisions)
-    ) == set(s.id for s in cut.supervisions)
+    first_ids = frozenset(s.id for s in cut_first_three.supervisions)
+    last_ids = frozenset(s.id for s in cut_last_three.supervisions)
+    assert first_ids.isdisjoint(last_ids)
+    assert first_ids | last_ids == all_ids
 
     # test duration filtering
     cut_first_three = cut.filter_supervisions(lambda s: s.duration <= 3)
     cut_last_three = cut.filter_supervisions(lambda s: s.duration > 3)
 
-    assert not set(s.id for s in cut_first_three.supervisions) & set(
-        s.id for s in cut_last_three.supervisions
-    )
-    assert (
-        set(s.id for s in cut_first_three.supervisions)
-        | set(s.id for s in cut_last_three.supervisions)
-    ) == set(s.id for s in cut.supervisions)
+    first_ids = frozenset(s.id for s in cut_first_three.supervisions)
+    last_ids = frozenset(s.id for s in cut_last_three.supervisions)
+    assert first_ids.isdisjoint(last_ids)
+    assert first_ids | last_ids == all_ids
 
 
-@pytest.fixture
-def dummy_recording_set_lazy():
-    with NamedTemporaryFile(suffix=".jsonl.gz") as f:
-        recs = RecordingSet.from_recordings(
-            [
-                Recording(
-                    id="rec1",
-                    sampling_rate=16000,
-                    num_samples=160000,
-                    duration=10,
-                    sources=[
-                        AudioSource(type="file", channels=[0], source="dummy.wav")
-                    ],
-                )
-            ]
-        )
-        recs.to_file(f.name)
-        f.flush()
-        yield RecordingSet.from_jsonl_lazy(f.name)
+# The lazy manifests below are only read by the tests,
+# so we serialize each of them to disk once per session.
 
 
-@pytest.fixture
-def dummy_supervision_set_lazy():
-    with NamedTemporaryFile(suffix=".jsonl.gz") as f:
-        sups = SupervisionSet.from_segments(
-            [
-                SupervisionSegment(
-                    id="sup1",
-                    recording_id="rec1",
-                    start=3,
-                    duration=4,
-                    channel=0,
-                    text="dummy text",
-                ),
-                SupervisionSegment(
-                    id="sup2",
-                    recording_id="rec1",
-                    start=7,
-                    duration=2,
-                    channel=0,
-                    text="dummy text",
-                ),
-            ]
-        )
-        sups.to_file(f.name)
-        f.flush()
-        yield SupervisionSet.from_jsonl_lazy(f.name)
+@pytest.fixture(scope="session")
+def dummy_recording_set_lazy(tmp_path_factory):
+    path = tmp_path_factory.mktemp("lazy") / "recordings.jsonl.gz"
+    recs = RecordingSet.from_recordings(
+        [
+            Recording(
+                id="rec1",
+                sampling_rate=16000,
+                num_samples=160000,
+                duration=10,
+                sources=[AudioSource(type="file", channels=[0], source="dummy.wav")],
+            )
+        ]
+    )
+    recs.to_file(path)
+    return RecordingSet.from_jsonl_lazy(path)
 
 
-@pytest.fixture
-def dummy_feature_set_lazy():
-    with NamedTemporaryFile(suffix=".jsonl.gz") as f:
-        feats = FeatureSet.from_features(
-            [
-                Features(
-                    recording_id="rec1",
-                    channels=0,
-                    start=0,
-                    duration=10,
-                    type="fbank",
-                    num_frames=1000,
-                    num_features=23,
-                    sampling_rate=16000,
-                    storage_type="lilcom_files",
-                    storage_path="feats",
-                    storage_key="dummy.llc",
-                    frame_shift=0.01,
-                )
-            ]
-        )
-        feats.to_file(f.name)
-        f.flush()
-        yield FeatureSet.from_jsonl_lazy(f.name)
+@pytest.fixture(scope="session")
+def dummy_supervision_set_lazy(tmp_path_factory):
+    path = tmp_path_factory.mktemp("lazy") / "supervisions.jsonl.gz"
+    sups = SupervisionSet.from_segments(
+        [
+            SupervisionSegment(
+                id="sup1",
+                recording_id="rec1",
+                start=3,
+                duration=4,
+                channel=0,
+                text="dummy text",
+            ),
+            SupervisionSegment(
+                id="sup2",
+                recording_id="rec1",
+                start=7,
+                duration=2,
+                channel=0,
+                text="dummy text",
+            ),
+        ]
+    )
+    sups.to_file(path)
+    return SupervisionSet.from_jsonl_lazy(path)
 
 
-class TestCreateCutSetLazy:
-    def test_make_cuts_from_recordings_supervisions(
-        self, dummy_recording_set_lazy, dummy_supervision_set_lazy
-    ):
-        with NamedTemporaryFile(suffix=".jsonl.gz") as f:
-            cut_set = CutSet.from_manifests(
-                recordings=dummy_recording_set_lazy,
-                supervisions=dummy_supervision_set_lazy,
-                lazy=True,
-                output_path=f.name,
-            )
-            f.flush()
-            cut1 = cut_set[0]
-            assert cut1.start == 0
-            assert cut1.duration == 10.0
-            assert cut1.end == 10.0
-            assert cut1.channel == 0
-
-            assert len(cut1.supervisions) == 2
-            assert cut1.supervisions[0].id == "sup1"
-            assert cut1.supervisions[0].recording_id == "rec1"
-            assert cut1.supervisions[0].start == 3.0
-            assert cut1.supervisions[0].end == 7.0
-            assert cut1.supervisions[0].channel == 0
-            assert cut1.supervisions[0].text == "dummy text"
-            assert cut1.supervisions[1].id == "sup2"
-            assert cut1.supervisions[1].recording_id == "rec1"
-            assert cut1.supervisions[1].start == 7.0
-            assert cut1.supervisions[1].end == 9.0
-            assert cut1.supervisions[1].channel == 0
-            assert cut1.supervisions[1].text == "dummy text"
-
-            assert cut1.has_recording
-            assert cut1.sampling_rate == 16000
-            assert cut1.recording_id == "rec1"
-            assert cut1.num_samples == 160000
-
-            assert not cut1.has_features
-            assert cut1.features is None
-            assert cut1.frame_shift is None
-            assert cut1.num_frames is None
-            assert cut1.num_features is None
-            assert cut1.features_type is None
-
-    def test_make_cuts_from_features_supervisions(
-        self, dummy_feature_set_lazy, dummy_supervision_set_lazy
-    ):
-        with NamedTemporaryFile(suffix=".jsonl.gz") as f:
-            cut_set = CutSet.from_manifests(
-                supervisions=dummy_supervision_set_lazy,
-                features=dummy_feature_set_lazy,
-                lazy=True,
-                output_path=f.name,
+@pytest.fixture(scope="session")
+def dummy_feature_set_lazy(tmp_path_factory):
+    path = tmp_path_factory.mktemp("lazy") / "features.jsonl.gz"
+    feats = FeatureSet.from_features(
+        [
+            Features(
+                recording_id="rec1",
+                channels=0,
+                start=0,
+                duration=10,
+                type="fbank",
+                num_frames=1000,
+                num_features=23,
+                sampling_rate=16000,
+                storage_type="lilcom_files",
+                storage_path="feats",
+                storage_key="dummy.llc",
+                frame_shift=0.01,
             )
-            f.flush()
-            cut1 = cut_set[0]
-            assert cut1.start == 0
-            assert cut1.duration == 10.0
-            assert cut1.end == 10.0
-            assert cut1.channel == 0
-
-            assert len(cut1.supervisions) == 2
-            assert cut1.supervisions[0].id == "sup1"
-            assert cut1.supervisions[0].recording_id == "rec1"
-            assert cut1.supervisions[0].start == 3.0
-            assert cut1.supervisions[0].end == 7.0
-            assert cut1.supervisions[0].channel == 0
-            assert cut1.supervisions[0].text == "dummy text"
-            assert cut1.supervisions[1].id == "sup2"
-            assert cut1.supervisions[1].recording_id == "rec1"
-            assert cut1.supervisions[1].start == 7.0
-            assert cut1.supervisions[1].end == 9.0
-            assert cut1.supervisions[1].channel == 0
-            assert cut1.supervisions[1].text == "dummy text"
-
-            assert not cut1.has_recording
-            assert cut1.recording is None
-            assert cut1.sampling_rate == 16000
-            assert cut1.recording_id == "rec1"
-            assert cut1.num_samples is None
-
-            assert cut1.has_features
-            assert cut1.frame_shift == 0.01
-            assert cut1.num_frames == 1000
-            assert cut1.num_features == 23
-            assert cut1.features_type == "fbank"
-
-    def test_make_cuts_from_recordings_features_supervisions(
+        ]
+    )
+    feats.to_file(path)
+    return FeatureSet.from_jsonl_lazy(path)
+
+
+class TestCreateCutSetLazy:
+    @pytest.mark.parametrize(
+        "with_recording, with_features",
+        [(True, False), (False, True), (True, True)],
+        ids=["rec", "feat", "rec+feat"],
+    )
+    def test_make_cuts_from_manifests(
         self,
         dummy_recording_set_lazy,
         dummy_feature_set_lazy,
         dummy_supervision_set_lazy,
+        tmp_path,
+        with_recording,
+        with_features,
     ):
-        with NamedTemporaryFile(suffix=".jsonl.gz") as f:
-            cut_set = CutSet.from_manifests(
-                recordings=dummy_recording_set_lazy,
-                supervisions=dummy_supervision_set_lazy,
-                features=dummy_feature_set_lazy,
-                lazy=True,
-                output_path=f.name,
-            )
-            f.flush()
-            cut1 = cut_set[0]
-            assert cut1.start == 0
-            assert cut1.duration == 10.0
-            assert cut1.end == 10.0
-            assert cut1.channel == 0
-
-            assert len(cut1.supervisions) == 2
-            assert cut1.supervisions[0].id == "sup1"
-            assert cut1.supervisions[0].recording_id == "rec1"
-            assert cut1.supervisions[0].start == 3.0
-            assert cut1.supervisions[0].end == 7.0
-            assert cut1.supervisions[0].channel == 0
-            assert cut1.supervisions[0].text == "dummy text"
-            assert cut1.supervisions[1].id == "sup2"
-            assert cut1.supervisions[1].recording_id == "rec1"
-            assert cut1.supervisions[1].start == 7.0
-            assert cut1.supervisions[1].end == 9.0
-            assert cut1.supervisions[1].channel == 0
-            assert cut1.supervisions[1].text == "dummy text"
-
-            assert cut1.has_recording
-            assert cut1.sampling_rate == 16000
-            assert cut1.recording_id == "rec1"
-            assert cut1.num_samples == 160000
-
-            assert cut1.has_features
-            assert cut1.frame_shift == 0.01
-            assert cut1.num_frames == 1000
-            assert cut1.num_features == 23
-            assert cut1.features_type == "fbank"
-
-
-def test_cut_has_overlapping_supervisions_false():
-    cut = MonoCut(
+        cut_set = CutSet.from_manifests(
+            recordings=dummy_recording_set_lazy if with_recording else None,
+            supervisions=dummy_supervision_set_lazy,
+            features=dummy_feature_set_lazy if with_features else None,
+            lazy=True,
+            output_path=tmp_path / "cuts.jsonl.gz",
+        )
+        cut1 = cut_set[0]
+
+        assert _attrs(cut1, CUT_ATTR_KEYS) == _expected_cut_attrs(
+            with_recording, with_features, trimmed=False
+        )
+
+        assert len(cut1.supervisions) == 2
+        assert _attrs(
+            cut1.supervisions[0], SUPERVISION_ATTR_KEYS
+        ) == _expected_supervision_attrs(trimmed=False)
+        assert _attrs(cut1.supervisions[1], SUPERVISION_ATTR_KEYS) == {
+            "id": "sup2",
+            "recording_id": "rec1",
+            "start": 7.0,
+            "duration": 2.0,
+            "end": 9.0,
+            "channel": 0,
+            "text": "dummy text",
+        }
+
+
+@pytest.fixture(scope="module")
+def overlap_base_cut() -> MonoCut:
+    # Shared base with the first supervision; each test derives a copy
+    # with the second supervision appended, so the cut is built only once.
+    return MonoCut(
         "id",
         start=0,
         duration=10,
         channel=0,
-        supervisions=[
-            dummy_supervision(0, start=0, duration=1),
-            dummy_supervision(0, start=5, duration=1),
-        ],
+        supervisions=[dummy_supervision(0, start=0, duration=1)],
+    )
+
+
+def _with_extra_supervision(cut: MonoCut, start: float) -> MonoCut:
+    return fastcopy(
+        cut,
+        supervisions=cut.supervisions + [dummy_supervision(0, start=start, duration=1)],
     )
+
+
+def test_cut_has_overlapping_supervisions_false(overlap_base_cut):
+    cut = _with_extra_supervision(overlap_base_cut, start=5)
     assert not cut.has_overlapping_supervisions
 
 
 @pytest.mark.parametrize("start", [0, 0.0001, 0.5, 0.99999])
-def test_cut_has_overlapping_supervisions_true(start):
-    cut = MonoCut(
-        "id",
-        start=0,
-        duration=10,
-        channel=0,
-        supervisions=[
-            dummy_supervision(0, start=0, duration=1),
-            dummy_supervision(0, start=start, duration=1),
-        ],
-    )
+def test_cut_has_overlapping_supervisions_true(overlap_base_cut, start):
+    cut = _with_extra_supervision(overlap_base_cut, start=start)
     assert cut.has_overlapping_supervisions
@@ -9,6 +9,11 @@ from lhotse.supervision import SupervisionSegment
 from lhotse.testing.dummies import DummyManifest, remove_spaces_from_segment_text
 from lhotse.utils import nullcontext as does_not_raise
 
+# Relative tolerance used when comparing floating-point cut durations.
+# This matches the ``math.isclose`` default; it is spelled out so the
+# tolerance in use is documented and consistent across the assertions.
+DURATION_RTOL = 1e-9
+
 # Note:
 # Definitions for `cut1`, `cut2`, `multi_cut1`, `multi_cut2`, and `cut_set` parameters are
 # standard Pytest fixtures located in test/cut/conftest.py
@@ -142,12 +147,20 @@ def test_overlay_cut_duration_and_supervisions(
         ]
 
 
+# The mix_cut_test manifests are only read by the tests, so they are parsed
+# once per session and the fixtures below hand out the shared cuts.
+
+
+@pytest.fixture(scope="session")
+def mixed_feature_cut_set() -> CutSet:
+    return CutSet.from_json("test/fixtures/mix_cut_test/overlayed_cut_manifest.json")
+
+
 @pytest.fixture
-def mixed_feature_cut() -> MixedCut:
-    cut_set = CutSet.from_json("test/fixtures/mix_cut_test/overlayed_cut_manifest.json")
-    mixed_cut = cut_set["mixed-cut-id"]
+def mixed_feature_cut(mixed_feature_cut_set) -> MixedCut:
+    mixed_cut = mixed_feature_cut_set["mixed-cut-id"]
     assert mixed_cut.num_frames == 1360
-    assert isclose(mixed_cut.duration, 13.595)
+    assert isclose(mixed_cut.duration, 13.595, rel_tol=DURATION_RTOL)
     return mixed_cut
 
 
@@ -170,23 +183,31 @@ def test_mixed_cut_map_supervisions(mixed_feature_cut):
             assert " " not in s.text
 
 
-@pytest.fixture
-def mixed_audio_cut() -> MixedCut:
-    cut_set = CutSet.from_json(
+@pytest.fixture(scope="session")
+def mixed_audio_cut_set() -> CutSet:
+    return CutSet.from_json(
         "test/fixtures/mix_cut_test/overlayed_audio_cut_manifest.json"
     )
-    mixed_cut = cut_set["mixed-cut-id"]
-    assert isclose(mixed_cut.duration, 14.4)
-    return mixed_cut
 
 
 @pytest.fixture
-def offseted_mixed_audio_cut() -> MixedCut:
-    cut_set = CutSet.from_json(
+def mixed_audio_cut(mixed_audio_cut_set) -> MixedCut:
+    mixed_cut = mixed_audio_cut_set["mixed-cut-id"]
+    assert isclose(mixed_cut.duration, 14.4, rel_tol=DURATION_RTOL)
+    return mixed_cut
+
+
+@pytest.fixture(scope="session")
+def offseted_mixed_audio_cut_set() -> CutSet:
+    return CutSet.from_json(
         "test/fixtures/mix_cut_test/offseted_audio_cut_manifest.json"
     )
-    mixed_cut = cut_set["mixed-cut-id"]
-    assert isclose(mixed_cut.duration, 16.66)
+
+
+@pytest.fixture
+def offseted_mixed_audio_cut(offseted_mixed_audio_cut_set) -> MixedCut:
+    mixed_cut = offseted_mixed_audio_cut_set["mixed-cut-id"]
+    assert isclose(mixed_cut.duration, 16.66, rel_tol=DURATION_RTOL)
     return mixed_cut
 
 